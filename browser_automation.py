@@ -9,12 +9,18 @@ Comprehensive examples for browser automation tasks including:
 - Data extraction
 """
 
+import asyncio
+import atexit
 import json
 import csv
+import random
 import time
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import asdict, dataclass, is_dataclass
+from typing import Optional, Union
+from urllib.parse import urlparse
 from playwright.sync_api import sync_playwright, Page, Browser, ElementHandle
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import async_playwright, Browser as AsyncBrowser, Page as AsyncPage
 
 
 # =============================================================================
@@ -53,26 +59,84 @@ def scrape_table_data(page: Page, table_selector: str) -> list[dict]:
     Returns:
         List of dicts, each representing a row with column headers as keys
     """
-    # Get header cells
-    headers = page.query_selector_all(f"{table_selector} thead th")
-    header_names = [h.inner_text().strip() for h in headers]
+    # Read headers and cells of every matching table in one round-trip
+    return page.locator(table_selector).evaluate_all("""(tables) => {
+        const heads = tables.flatMap(t => [...t.querySelectorAll('thead th')])
+            .map(h => h.innerText.trim());
+        return tables.flatMap(t => [...t.querySelectorAll('tbody tr')]).map(row => {
+            const data = {};
+            [...row.querySelectorAll('td')].forEach((cell, i) => {
+                if (i < heads.length) data[heads[i]] = cell.innerText.trim();
+            });
+            return data;
+        });
+    }""")
+
+
+def parse_table_html(html: str, table_selector: str) -> list[dict]:
+    """
+    Parse table rows out of an HTML snapshot, without a live browser.
 
-    # Get data rows
-    rows = page.query_selector_all(f"{table_selector} tbody tr")
-    data = []
+    Same rows and columns as scrape_table_data, but works on saved HTML
+    (e.g. from page.content() cached to disk). Cell text is whitespace-
+    collapsed, which approximates innerText; it can still differ where CSS
+    affects rendering (hidden elements, <br>). Requires the optional
+    selectolax package.
 
-    for row in rows:
-        cells = row.query_selector_all("td")
-        row_data = {}
-        for i, cell in enumerate(cells):
-            if i < len(header_names):
-                row_data[header_names[i]] = cell.inner_text().strip()
-        data.append(row_data)
+    Args:
+        html: HTML document
+        table_selector: CSS selector for the table
 
-    return data
+    Returns:
+        List of dicts, each representing a row with column headers as keys
+    """
+    from selectolax.lexbor import LexborHTMLParser
+
+    def text_of(node):
+        return " ".join(node.text().split())
+
+    tables = LexborHTMLParser(html).css(table_selector)
+    header_names = [text_of(h) for table in tables for h in table.css("thead th")]
+    return [
+        {header_names[i]: text_of(cell)
+         for i, cell in enumerate(row.css("td")) if i < len(header_names)}
+        for table in tables
+        for row in table.css("tbody tr")
+    ]
 
 
-def scrape_product_listings(page: Page, container_selector: str) -> list[ScrapedProduct]:
+def scrape_table_fast(page: Page, table_selector: str) -> list[dict]:
+    """Scrape a table from one page.content() snapshot, parsed outside the browser."""
+    return parse_table_html(page.content(), table_selector)
+
+
+# Flexible selectors that work across many sites
+PRODUCT_FIELD_SELECTORS = {
+    "name": "h2, h3, .product-title, .item-title, [data-testid='title']",
+    "price": ".price, .product-price, [data-testid='price']",
+    "rating": ".rating, .stars, [aria-label*='rating']",
+    "url": "a[href]",
+}
+
+# Walks every container once, letting the browser's native selector engine
+# match all four fields per item
+_PRODUCT_LISTINGS_JS = """(items, fields) => items.map(item => {
+    const name = item.querySelector(fields.name);
+    const price = item.querySelector(fields.price);
+    if (!name || !price) return null;
+    const rating = item.querySelector(fields.rating);
+    const link = item.querySelector(fields.url);
+    return {
+        name: name.innerText.trim(),
+        price: price.innerText.trim(),
+        rating: rating ? rating.innerText.trim() : null,
+        url: link ? link.getAttribute("href") : null,
+    };
+}).filter(Boolean)"""
+
+
+def scrape_product_listings(page: Page, container_selector: str,
+                            field_selectors: dict = PRODUCT_FIELD_SELECTORS) -> list[ScrapedProduct]:
     """
     Scrape product listings from an e-commerce page.
 
@@ -81,29 +145,16 @@ def scrape_product_listings(page: Page, container_selector: str) -> list[Scraped
     Args:
         page: Playwright page object
         container_selector: CSS selector for product containers
+        field_selectors: Per-field CSS selectors ("name", "price", "rating", "url");
+            fields left out fall back to PRODUCT_FIELD_SELECTORS
 
     Returns:
         List of ScrapedProduct objects
     """
-    products = []
-    items = page.query_selector_all(container_selector)
-
-    for item in items:
-        # Flexible selectors that work across many sites
-        name_el = item.query_selector("h2, h3, .product-title, .item-title, [data-testid='title']")
-        price_el = item.query_selector(".price, .product-price, [data-testid='price'], span:has-text('$')")
-        rating_el = item.query_selector(".rating, .stars, [aria-label*='rating']")
-        link_el = item.query_selector("a[href]")
+    selectors = {**PRODUCT_FIELD_SELECTORS, **field_selectors}
+    items = page.locator(container_selector).evaluate_all(_PRODUCT_LISTINGS_JS, selectors)
 
-        if name_el and price_el:
-            products.append(ScrapedProduct(
-                name=name_el.inner_text().strip(),
-                price=price_el.inner_text().strip(),
-                rating=rating_el.inner_text().strip() if rating_el else None,
-                url=link_el.get_attribute("href") if link_el else None
-            ))
-
-    return products
+    return [ScrapedProduct(**item) for item in items]
 
 
 def scrape_with_pagination(page: Page, item_selector: str, next_button_selector: str,
@@ -111,6 +162,12 @@ def scrape_with_pagination(page: Page, item_selector: str, next_button_selector:
     """
     Scrape items across multiple pages.
 
+    When the "next" control is a link, the next page is loaded in a second
+    tab while the current one is being scraped, so fetching page N+1
+    overlaps parsing page N. Other controls (e.g. JS buttons) are clicked
+    and waited for as usual. Prefetch tabs are closed before returning;
+    the page passed in may be left on an earlier page of results.
+
     Args:
         page: Playwright page object
         item_selector: CSS selector for items to scrape
@@ -121,48 +178,70 @@ def scrape_with_pagination(page: Page, item_selector: str, next_button_selector:
         List of scraped item texts
     """
     all_items = []
-
-    for page_num in range(max_pages):
-        print(f"Scraping page {page_num + 1}...")
-
-        # Wait for items to load
-        page.wait_for_selector(item_selector)
-
-        # Scrape current page
-        items = page.query_selector_all(item_selector)
-        all_items.extend([item.inner_text().strip() for item in items])
-
-        # Try to go to next page
-        next_button = page.query_selector(next_button_selector)
-        if next_button and next_button.is_visible() and next_button.is_enabled():
-            next_button.click()
-            page.wait_for_load_state("networkidle")
-        else:
-            print("No more pages")
-            break
+    current = page
+
+    try:
+        for page_num in range(max_pages):
+            print(f"Scraping page {page_num + 1}...")
+
+            # Wait for items to load
+            current.wait_for_selector(item_selector)
+            items = current.locator(item_selector)
+
+            if page_num + 1 == max_pages:
+                all_items.extend(text.strip() for text in items.all_inner_texts())
+                break
+
+            next_button = current.locator(next_button_selector).first
+            if not (next_button.is_visible() and next_button.is_enabled()):
+                all_items.extend(text.strip() for text in items.all_inner_texts())
+                print("No more pages")
+                break
+
+            next_url = next_button.evaluate("el => el.href || null")
+            if next_url:
+                # Start loading the next page in its own tab, scrape this one
+                # while it loads, then wait for it only when it's needed
+                upcoming = current.context.new_page()
+                with upcoming.expect_navigation(wait_until="domcontentloaded"):
+                    upcoming.evaluate("url => setTimeout(() => { location.href = url; })", next_url)
+                    all_items.extend(text.strip() for text in items.all_inner_texts())
+                if current is not page:
+                    current.close()
+                current = upcoming
+            else:
+                all_items.extend(text.strip() for text in items.all_inner_texts())
+                next_button.click()
+                current.wait_for_load_state("domcontentloaded")
+    finally:
+        if current is not page:
+            current.close()
 
     return all_items
 
 
-def extract_structured_data(page: Page) -> dict:
+def extract_structured_data(page: Page) -> list:
     """
     Extract JSON-LD structured data from a page (common for SEO).
 
-    Many sites include structured data for products, articles, etc.
+    Many sites include structured data for products, articles, etc., often
+    spread over several blocks (e.g. WebSite boilerplate plus a Product).
 
     Returns:
-        Parsed JSON-LD data or empty dict
+        List of every parsed JSON-LD block, skipping invalid ones
     """
-    scripts = page.query_selector_all('script[type="application/ld+json"]')
+    contents = page.locator('script[type="application/ld+json"]').evaluate_all(
+        "scripts => scripts.map(s => s.textContent)"
+    )
 
-    for script in scripts:
+    data = []
+    for content in contents:
         try:
-            content = script.inner_text()
-            return json.loads(content)
+            data.append(json.loads(content))
         except json.JSONDecodeError:
             continue
 
-    return {}
+    return data
 
 
 # =============================================================================
@@ -182,14 +261,8 @@ def fill_select_dropdown(page: Page, selector: str, value: str):
 
 
 def fill_checkbox(page: Page, selector: str, should_check: bool = True):
-    """Check or uncheck a checkbox."""
-    checkbox = page.locator(selector)
-    is_checked = checkbox.is_checked()
-
-    if should_check and not is_checked:
-        checkbox.check()
-    elif not should_check and is_checked:
-        checkbox.uncheck()
+    """Check or uncheck a checkbox (no-op if already in that state)."""
+    page.set_checked(selector, should_check)
 
 
 def fill_radio_button(page: Page, selector: str):
@@ -216,10 +289,32 @@ def fill_complex_form(page: Page, fields: list[FormField]):
             fill_radio_button(page, field.selector)
 
 
+# Common login form selectors, one alternative per entry
+LOGIN_USERNAME_SELECTORS = ("#username", "#email", "input[name='email']", "input[type='email']")
+LOGIN_PASSWORD_SELECTORS = ("#password", "input[name='password']", "input[type='password']")
+LOGIN_SUBMIT_SELECTORS = ("button[type='submit']", "input[type='submit']")
+
+
+def _first_match(page: Page, selectors: Union[str, tuple[str, ...]]):
+    """
+    Locator for the first element matching a selector or any of several alternatives.
+
+    Alternatives are combined into one locator with Locator.or_ (Playwright 1.33+).
+    """
+    if isinstance(selectors, str):
+        return page.locator(selectors).first
+    if not selectors:
+        raise ValueError("At least one selector is required")
+    locator = page.locator(selectors[0])
+    for selector in selectors[1:]:
+        locator = locator.or_(page.locator(selector))
+    return locator.first
+
+
 def fill_login_form(page: Page, username: str, password: str,
-                    username_selector: str = "#username, #email, input[name='email'], input[type='email']",
-                    password_selector: str = "#password, input[name='password'], input[type='password']",
-                    submit_selector: str = "button[type='submit'], input[type='submit']"):
+                    username_selector: Union[str, tuple[str, ...]] = LOGIN_USERNAME_SELECTORS,
+                    password_selector: Union[str, tuple[str, ...]] = LOGIN_PASSWORD_SELECTORS,
+                    submit_selector: Union[str, tuple[str, ...]] = LOGIN_SUBMIT_SELECTORS):
     """
     Fill and submit a login form with common selector patterns.
 
@@ -227,31 +322,53 @@ def fill_login_form(page: Page, username: str, password: str,
         page: Playwright page object
         username: Username or email
         password: Password
-        username_selector: CSS selector for username field
-        password_selector: CSS selector for password field
-        submit_selector: CSS selector for submit button
+        username_selector: CSS selector, or tuple of alternatives, for username field
+        password_selector: CSS selector, or tuple of alternatives, for password field
+        submit_selector: CSS selector, or tuple of alternatives, for submit button
     """
-    page.fill(username_selector, username)
-    page.fill(password_selector, password)
-    page.click(submit_selector)
-    page.wait_for_load_state("networkidle")
+    _first_match(page, username_selector).fill(username)
+    _first_match(page, password_selector).fill(password)
+    _first_match(page, submit_selector).click()
+    page.wait_for_load_state("domcontentloaded")
 
 
 # =============================================================================
 # CLICKING AND NAVIGATION
 # =============================================================================
 
-def click_and_wait(page: Page, selector: str, wait_for: str = "networkidle"):
+def goto_fast(page: Page, url: str, ready_selector: str, timeout: int = 5000):
+    """
+    Navigate and wait only for the element the next step needs.
+
+    Returns as soon as ready_selector is present, instead of waiting for
+    the load event or for analytics traffic to go quiet.
+
+    Args:
+        page: Playwright page object
+        url: URL to open
+        ready_selector: CSS selector that signals the page is usable
+        timeout: Maximum wait for ready_selector in milliseconds
+    """
+    page.goto(url, wait_until="domcontentloaded")
+    page.wait_for_selector(ready_selector, timeout=timeout)
+
+
+def click_and_wait(page: Page, selector: str, wait_for: str = "domcontentloaded",
+                   selector_ready: Optional[str] = None):
     """
     Click an element and wait for page to settle.
 
     Args:
         page: Playwright page object
         selector: CSS selector for element to click
-        wait_for: What to wait for - "networkidle", "load", "domcontentloaded"
+        wait_for: What to wait for - "domcontentloaded", "load", "networkidle"
+        selector_ready: CSS selector to wait for instead of a load state
     """
     page.click(selector)
-    page.wait_for_load_state(wait_for)
+    if selector_ready:
+        page.wait_for_selector(selector_ready)
+    else:
+        page.wait_for_load_state(wait_for)
 
 
 def click_with_navigation(page: Page, selector: str) -> str:
@@ -359,12 +476,26 @@ def custom_wait_condition(page: Page, condition_fn, timeout: int = 30000, poll_i
     """
     Wait for a custom condition to be true.
 
+    Prefer passing a JavaScript expression: it is polled inside the browser
+    via page.wait_for_function, with no round-trip per check. Python
+    callables are still supported but poll from Python, one round-trip each.
+
+    Example:
+        custom_wait_condition(page, "document.querySelectorAll('.row').length >= 20")
+
     Args:
         page: Playwright page object
-        condition_fn: Function that takes page and returns bool
+        condition_fn: JavaScript expression, or function that takes page and returns bool
         timeout: Maximum wait time in ms
         poll_interval: How often to check in ms
     """
+    if isinstance(condition_fn, str):
+        try:
+            page.wait_for_function(condition_fn, timeout=timeout, polling=poll_interval)
+        except PlaywrightTimeoutError:
+            raise TimeoutError(f"Condition not met within {timeout}ms") from None
+        return True
+
     start = time.time() * 1000
     while (time.time() * 1000) - start < timeout:
         if condition_fn(page):
@@ -377,40 +508,61 @@ def custom_wait_condition(page: Page, condition_fn, timeout: int = 30000, poll_i
 # UTILITY FUNCTIONS
 # =============================================================================
 
-def take_screenshot(page: Page, url: str, filename: str) -> str:
-    """Navigate to URL and take a screenshot."""
-    page.goto(url)
-    page.wait_for_load_state("networkidle")
+def take_screenshot(page: Page, url: str, filename: str,
+                    wait_for: Optional[str] = None, timeout: int = 30000) -> str:
+    """
+    Navigate to URL and take a screenshot.
+
+    If wait_for is given, wait up to timeout ms for that selector instead of
+    the full load event.
+    """
+    if wait_for:
+        goto_fast(page, url, wait_for, timeout=timeout)
+    else:
+        page.goto(url)
     screenshot_path = f"{filename}.png"
     page.screenshot(path=screenshot_path, full_page=True)
     return screenshot_path
 
 
 def save_to_csv(data: list[dict], filename: str):
-    """Save scraped data to CSV file."""
+    """
+    Save scraped data to CSV file.
+
+    Columns come from the first row; keys missing from later rows are written
+    as empty cells and extra keys are ignored.
+    """
     if not data:
         return
 
-    with open(filename, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=data[0].keys())
-        writer.writeheader()
-        writer.writerows(data)
+    columns = list(data[0].keys())
+    with open(filename, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        writer.writerows(tuple(row.get(col, "") for col in columns) for row in data)
+
+
+def _json_default(obj):
+    """Serialize dataclasses (e.g. ScrapedProduct) that json can't handle natively."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 def save_to_json(data, filename: str):
-    """Save data to JSON file."""
+    """Save data to JSON file. Dataclass instances are written as objects."""
+    # Encode in one go and write once, rather than many small chunked writes
+    content = json.dumps(data, indent=2, ensure_ascii=False, default=_json_default)
     with open(filename, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.write(content)
 
 
 def get_all_links(page: Page) -> list[dict]:
     """Extract all links from the current page."""
-    links = page.query_selector_all("a[href]")
-    return [
-        {"text": link.inner_text().strip(), "href": link.get_attribute("href")}
-        for link in links
-        if link.get_attribute("href")
-    ]
+    pairs = page.locator("a[href]").evaluate_all(
+        "links => links.map(a => [a.innerText.trim(), a.getAttribute('href')])"
+    )
+    return [{"text": text, "href": href} for text, href in pairs if href]
 
 
 def get_page_text(page: Page) -> str:
@@ -435,19 +587,65 @@ def intercept_requests(page: Page, url_pattern: str, handler):
     page.route(url_pattern, handler)
 
 
+# Resource types and tracker hosts that scraping never needs
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+BLOCKED_TRACKER_HOSTS = frozenset({
+    "www.google-analytics.com",
+    "www.googletagmanager.com",
+    "stats.g.doubleclick.net",
+    "googleads.g.doubleclick.net",
+    "connect.facebook.net",
+    "static.hotjar.com",
+    "script.hotjar.com",
+    "bat.bing.com",
+    "cdn.segment.com",
+    "api.segment.io",
+})
+
+
+def install_resource_blocker(target, resource_types=BLOCKED_RESOURCE_TYPES,
+                             tracker_hosts=BLOCKED_TRACKER_HOSTS):
+    """
+    Abort requests for unneeded resource types and known tracker hosts.
+
+    Stylesheets are left alone so visibility checks and screenshots still
+    behave as they would for a user.
+
+    Works with both the sync and async APIs; with the async API, await the
+    returned value.
+
+    Args:
+        target: Playwright page or browser context (a context covers all its pages)
+        resource_types: Request resource types to abort
+        tracker_hosts: Hostnames whose requests are always aborted
+    """
+    def handle(route):
+        request = route.request
+        if (request.resource_type in resource_types
+                or urlparse(request.url).netloc in tracker_hosts):
+            return route.abort()
+        return route.continue_()
+
+    return target.route("**/*", handle)
+
+
 # =============================================================================
 # RETRY LOGIC
 # =============================================================================
 
+# Keywords (lowercase) that mark an error as worth retrying or not
+TRANSIENT_ERROR_KEYWORDS = ("timeout", "timed out", "network", "connection",
+                            "econnreset", "502", "503", "504")
+PERMANENT_ERROR_KEYWORDS = ("404", "not found", "forbidden", "401", "403")
+
+
 def should_retry_on_error(error_message: str, attempt: int, max_attempts: int) -> bool:
     """
     Determine whether to retry an operation after an error.
 
-    TODO: Implement your retry logic here!
-
-    Consider:
-    - Which errors are transient (network timeouts) vs permanent (404)?
-    - Should you use exponential backoff?
+    Permanent errors (404, forbidden, ...) are never retried; transient ones
+    (timeouts, connection problems, 5xx gateways) are retried until
+    max_attempts is reached.
 
     Args:
         error_message: The error message from the failed operation
@@ -457,14 +655,25 @@ def should_retry_on_error(error_message: str, attempt: int, max_attempts: int) -
     Returns:
         True if should retry, False otherwise
     """
-    # YOUR IMPLEMENTATION HERE (5-10 lines)
-    # Hint: Check for keywords like "timeout", "network", "connection"
-    # vs permanent errors like "404", "not found", "forbidden"
-    pass
+    message = error_message.lower()
+    if any(keyword in message for keyword in PERMANENT_ERROR_KEYWORDS):
+        return False
+    if attempt >= max_attempts:
+        return False
+    return any(keyword in message for keyword in TRANSIENT_ERROR_KEYWORDS)
+
 
+def run_with_retry(func, *args, backoff_page: Optional[Page] = None, max_attempts: int = 3,
+                   **kwargs):
+    """
+    Execute a function with retry logic.
 
-def run_with_retry(func, *args, max_attempts: int = 3, **kwargs):
-    """Execute a function with retry logic."""
+    If backoff_page is given, the backoff uses its wait_for_timeout so
+    Playwright keeps processing browser events while waiting; otherwise it
+    sleeps. All other arguments, including page, are passed to func.
+    For async code, retry with await asyncio.sleep(...) instead so other
+    pages keep running during the backoff.
+    """
     for attempt in range(1, max_attempts + 1):
         try:
             return func(*args, **kwargs)
@@ -472,7 +681,12 @@ def run_with_retry(func, *args, max_attempts: int = 3, **kwargs):
             error_msg = str(e)
             if should_retry_on_error(error_msg, attempt, max_attempts):
                 print(f"Attempt {attempt} failed: {error_msg}. Retrying...")
-                time.sleep(2 ** attempt)  # Exponential backoff
+                # Exponential backoff with jitter so parallel workers don't retry in lockstep
+                delay = min(30, (2 ** attempt) * random.uniform(0.5, 1.5))
+                if backoff_page is not None:
+                    backoff_page.wait_for_timeout(delay * 1000)
+                else:
+                    time.sleep(delay)
                 continue
             raise
 
@@ -481,11 +695,24 @@ def run_with_retry(func, *args, max_attempts: int = 3, **kwargs):
 # BROWSER SETUP HELPERS
 # =============================================================================
 
+def _context_options(viewport_width: int = 1280,
+                     viewport_height: int = 720,
+                     user_agent: str = None,
+                     locale: str = "en-US") -> dict:
+    """Keyword arguments for browser.new_context(), shared by the sync and async setups."""
+    return {
+        "viewport": {"width": viewport_width, "height": viewport_height},
+        "user_agent": user_agent or "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0",
+        "locale": locale,
+    }
+
+
 def create_browser_context(browser: Browser,
                            viewport_width: int = 1280,
                            viewport_height: int = 720,
                            user_agent: str = None,
-                           locale: str = "en-US"):
+                           locale: str = "en-US",
+                           block_resources: bool = True):
     """
     Create a configured browser context.
 
@@ -495,12 +722,79 @@ def create_browser_context(browser: Browser,
         viewport_height: Browser window height
         user_agent: Custom user agent string
         locale: Browser locale
+        block_resources: Skip images, media, fonts and trackers on every page
     """
-    return browser.new_context(
-        viewport={"width": viewport_width, "height": viewport_height},
-        user_agent=user_agent or "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0",
-        locale=locale
+    context = browser.new_context(
+        **_context_options(viewport_width, viewport_height, user_agent, locale)
     )
+    if block_resources:
+        install_resource_blocker(context)
+    return context
+
+
+async def create_async_browser_context(browser: AsyncBrowser, block_resources: bool = True,
+                                       **options):
+    """
+    Async API counterpart of create_browser_context.
+
+    Takes the same options (viewport_width, viewport_height, user_agent,
+    locale, block_resources) and applies them the same way.
+    """
+    context = await browser.new_context(**_context_options(**options))
+    if block_resources:
+        await install_resource_blocker(context)
+    return context
+
+
+# Chromium flags for headless scraping: skip the GPU process, extensions,
+# background services and image decoding
+LAUNCH_ARGS = [
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--blink-settings=imagesEnabled=false",
+]
+
+# Shared browser, started on first use by get_page() and reused afterwards
+_PLAYWRIGHT = None
+_BROWSER = None
+_CONTEXT = None
+
+
+def get_page() -> Page:
+    """
+    Open a new page in a shared, lazily launched browser context.
+
+    The first call starts Playwright and Chromium; later calls in the same
+    process reuse them, so only the first pays browser startup. Everything
+    is closed automatically at interpreter exit.
+    """
+    global _PLAYWRIGHT, _BROWSER, _CONTEXT
+    if _CONTEXT is None:
+        playwright = sync_playwright().start()
+        try:
+            browser = playwright.chromium.launch(headless=True, args=LAUNCH_ARGS)
+            context = create_browser_context(browser)
+        except Exception:
+            # Leave nothing half-started so the next call can retry cleanly
+            playwright.stop()
+            raise
+        _PLAYWRIGHT, _BROWSER, _CONTEXT = playwright, browser, context
+        atexit.register(_close_shared_browser)
+    return _CONTEXT.new_page()
+
+
+def _close_shared_browser():
+    """Close the browser started by get_page()."""
+    global _PLAYWRIGHT, _BROWSER, _CONTEXT
+    if _PLAYWRIGHT is None:
+        return
+    _CONTEXT.close()
+    _BROWSER.close()
+    _PLAYWRIGHT.stop()
+    _PLAYWRIGHT = _BROWSER = _CONTEXT = None
 
 
 def setup_request_logging(page: Page):
@@ -513,23 +807,30 @@ def setup_request_logging(page: Page):
 # MAIN DEMO
 # =============================================================================
 
-def demo_scraping(page: Page):
+# Demo targets
+HN_URL = "https://news.ycombinator.com"
+HN_TITLE_SELECTOR = ".titleline > a"
+DDG_URL = "https://duckduckgo.com"
+DDG_SEARCH_INPUT = 'input[name="q"]'
+WIKIPEDIA_URL = "https://en.wikipedia.org"
+WIKIPEDIA_ABOUT_LINK = 'a:has-text("About Wikipedia")'
+
+
+async def demo_scraping(page: AsyncPage, wait_for: Optional[str] = HN_TITLE_SELECTOR):
     """Demonstrate scraping capabilities."""
     print("\n" + "="*50)
     print("SCRAPING DEMO: Hacker News")
     print("="*50)
 
-    page.goto("https://news.ycombinator.com")
-    page.wait_for_load_state("networkidle")
+    await page.goto(HN_URL, wait_until="domcontentloaded")
+    if wait_for:
+        await page.wait_for_selector(wait_for, state="attached")
 
     # Scrape article titles and links
-    items = page.query_selector_all(".titleline > a")
-    articles = []
-    for item in items[:10]:
-        articles.append({
-            "title": item.inner_text(),
-            "url": item.get_attribute("href")
-        })
+    pairs = await page.locator(HN_TITLE_SELECTOR).evaluate_all(
+        "links => links.slice(0, 10).map(a => [a.innerText, a.getAttribute('href')])"
+    )
+    articles = [{"title": title, "url": url} for title, url in pairs]
 
     for i, article in enumerate(articles, 1):
         print(f"{i}. {article['title'][:60]}...")
@@ -537,77 +838,112 @@ def demo_scraping(page: Page):
     return articles
 
 
-def demo_form_filling(page: Page):
+async def demo_form_filling(page: AsyncPage):
     """Demonstrate form filling capabilities."""
     print("\n" + "="*50)
     print("FORM DEMO: DuckDuckGo Search")
     print("="*50)
 
-    page.goto("https://duckduckgo.com")
+    await page.goto(DDG_URL, wait_until="domcontentloaded")
 
-    # Fill search box
-    fill_text_field(page, 'input[name="q"]', "Playwright Python automation")
+    # Fill search box (fill replaces any existing content)
+    await page.fill(DDG_SEARCH_INPUT, "Playwright Python automation")
 
     # Submit form
-    page.press('input[name="q"]', "Enter")
-    page.wait_for_load_state("networkidle")
+    async with page.expect_navigation(wait_until="domcontentloaded"):
+        await page.press(DDG_SEARCH_INPUT, "Enter")
 
     print(f"Searched! Current URL: {page.url}")
     return page.url
 
 
-def demo_navigation(page: Page):
+async def demo_navigation(page: AsyncPage, wait_for: Optional[str] = None):
     """Demonstrate navigation capabilities."""
     print("\n" + "="*50)
     print("NAVIGATION DEMO: Wikipedia")
     print("="*50)
 
-    page.goto("https://en.wikipedia.org")
+    await page.goto(WIKIPEDIA_URL, wait_until="domcontentloaded")
 
     # Click on a link
     print("Clicking 'About Wikipedia' link...")
-    click_and_wait(page, 'a:has-text("About Wikipedia")')
+    await page.click(WIKIPEDIA_ABOUT_LINK)
+    if wait_for:
+        await page.wait_for_selector(wait_for)
+    else:
+        await page.wait_for_load_state("domcontentloaded")
 
-    print(f"Navigated to: {page.title()}")
+    print(f"Navigated to: {await page.title()}")
     return page.url
 
 
-def main():
-    """Main entry point demonstrating browser automation."""
+async def run_demo(context, demo):
+    """Run one demo on its own page, saving a screenshot if it fails."""
+    page = await context.new_page()
+    try:
+        return await demo(page)
+    except Exception:
+        screenshot_path = f"error_{demo.__name__}.png"
+        try:
+            await page.screenshot(path=screenshot_path)
+            print(f"Error screenshot saved to: {screenshot_path}")
+        except Exception as screenshot_error:
+            # The page may have crashed or closed; keep the demo's own error
+            print(f"Could not save error screenshot: {screenshot_error}")
+        raise
+    finally:
+        await page.close()
+
 
+async def amain():
+    """
+    Run all demos concurrently.
+
+    The demos hit unrelated sites, so each gets its own page in a single
+    shared context and their network waits overlap.
+    """
     print("="*50)
     print("Chrome Browser Automation Demo")
     print("="*50)
 
-    with sync_playwright() as p:
+    async with async_playwright() as p:
         # Launch browser in headless mode for reliability
-        browser = p.chromium.launch(headless=True)
+        browser = await p.chromium.launch(headless=True, args=LAUNCH_ARGS)
 
         # Create browser context
-        context = create_browser_context(browser)
-        page = context.new_page()
+        context = await create_async_browser_context(browser)
 
-        # Run demos
+        # Run demos; each one's failure is collected rather than cancelling the rest
+        demos = (demo_scraping, demo_form_filling, demo_navigation)
         try:
-            articles = demo_scraping(page)
-            save_to_json(articles, "scraped_articles.json")
-            print("\nSaved to: scraped_articles.json")
+            results = await asyncio.gather(
+                *(run_demo(context, demo) for demo in demos),
+                return_exceptions=True,
+            )
+
+            articles = results[0]
+            if not isinstance(articles, BaseException):
+                save_to_json(articles, "scraped_articles.json")
+                print("\nSaved to: scraped_articles.json")
+
+            failures = [(demo, result) for demo, result in zip(demos, results)
+                        if isinstance(result, BaseException)]
+            for demo, error in failures:
+                print(f"\nError in {demo.__name__}: {error}")
+
+            if not failures:
+                print("\n" + "="*50)
+                print("All demos completed successfully!")
+                print("="*50)
 
-            demo_form_filling(page)
-            demo_navigation(page)
-
-            print("\n" + "="*50)
-            print("All demos completed successfully!")
-            print("="*50)
+        finally:
+            await context.close()
+            await browser.close()
 
-        except Exception as e:
-            print(f"\nError: {e}")
-            page.screenshot(path="error_screenshot.png")
-            print("Error screenshot saved to: error_screenshot.png")
 
-        finally:
-            context.close()
-            browser.close()
+def main():
+    """Main entry point demonstrating browser automation."""
+    asyncio.run(amain())
 
 
 if __name__ == "__main__":
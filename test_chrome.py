@@ -6,20 +6,51 @@ This approach works reliably in WSL by:
 2. Connecting to it via WebSocket from Playwright
 """
 
+import atexit
 import subprocess
 import time
 import socket
+import struct
 from playwright.sync_api import sync_playwright
 
 DEBUG_PORT = 9222
 
+# CDP connection kept open for the life of the process, see get_browser()
+_PLAYWRIGHT = None
+_BROWSER = None
 
-def is_port_in_use(port: int) -> bool:
+
+def is_port_in_use(port: int, timeout: float = None) -> bool:
     """Check if a port is already in use."""
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        # Reset on close instead of leaving the probe socket in TIME_WAIT
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+        s.settimeout(timeout)
         return s.connect_ex(('localhost', port)) == 0
 
 
+def wait_for_port(port: int, deadline: float = 10.0) -> bool:
+    """
+    Wait until something is listening on a port.
+
+    Polls quickly at first and backs off to at most 200ms between probes,
+    so a fast startup is noticed almost immediately.
+    """
+    start = time.monotonic()
+    delay = 0.02
+    next_report = 2.0
+    while time.monotonic() - start < deadline:
+        if is_port_in_use(port, timeout=0.1):
+            return True
+        time.sleep(delay)
+        delay = min(delay * 1.5, 0.2)
+        elapsed = time.monotonic() - start
+        if elapsed >= next_report:
+            print(f"  Still waiting... ({elapsed:.1f}s)")
+            next_report += 2.0
+    return False
+
+
 def start_chrome_with_debugging():
     """Start Chrome with remote debugging enabled using cmd.exe."""
     if is_port_in_use(DEBUG_PORT):
@@ -40,18 +71,40 @@ def start_chrome_with_debugging():
 
     # Wait for Chrome to start
     print("Waiting for Chrome to start...")
-    for i in range(20):
-        if is_port_in_use(DEBUG_PORT):
-            print(f"Chrome started on port {DEBUG_PORT}")
-            return True
-        time.sleep(0.5)
-        if i % 4 == 3:
-            print(f"  Still waiting... ({(i+1)/2}s)")
+    if wait_for_port(DEBUG_PORT):
+        print(f"Chrome started on port {DEBUG_PORT}")
+        return True
 
     print("Warning: Chrome may not have started correctly")
     return False
 
 
+def get_browser():
+    """
+    Connect to the debugging Chrome over CDP, reusing the connection if one exists.
+
+    Chrome itself keeps running after this process exits; only the
+    Playwright connection is closed at exit.
+    """
+    global _PLAYWRIGHT, _BROWSER
+    if _BROWSER is None or not _BROWSER.is_connected():
+        if _PLAYWRIGHT is None:
+            _PLAYWRIGHT = sync_playwright().start()
+            atexit.register(_disconnect)
+        _BROWSER = _PLAYWRIGHT.chromium.connect_over_cdp(f"http://localhost:{DEBUG_PORT}")
+    return _BROWSER
+
+
+def _disconnect():
+    """Drop the CDP connection opened by get_browser()."""
+    global _PLAYWRIGHT, _BROWSER
+    if _BROWSER is not None:
+        _BROWSER.close()
+    if _PLAYWRIGHT is not None:
+        _PLAYWRIGHT.stop()
+    _PLAYWRIGHT = _BROWSER = None
+
+
 def main():
     print("=" * 50)
     print("Chrome Automation Test (WSL via CDP)")
@@ -69,28 +122,28 @@ def main():
         return
 
     try:
-        with sync_playwright() as p:
-            print("\n1. Connecting to Chrome via CDP...")
-            browser = p.chromium.connect_over_cdp(f"http://localhost:{DEBUG_PORT}")
+        print("\n1. Connecting to Chrome via CDP...")
+        browser = get_browser()
 
-            print("2. Getting browser context...")
-            context = browser.contexts[0] if browser.contexts else browser.new_context()
+        print("2. Getting browser context...")
+        context = browser.contexts[0] if browser.contexts else browser.new_context()
 
-            print("3. Creating new page...")
-            page = context.new_page()
+        print("3. Creating new page...")
+        page = context.new_page()
 
-            print("4. Navigating to example.com...")
-            page.goto("https://example.com")
+        print("4. Navigating to example.com...")
+        page.goto("https://example.com")
 
-            print(f"5. Page title: {page.title()}")
+        print(f"5. Page title: {page.title()}")
 
-            print("6. Taking screenshot...")
-            page.screenshot(path="test_screenshot.png")
+        print("6. Taking screenshot...")
+        page.screenshot(path="test_screenshot.png")
+        page.close()
 
-            print("\n" + "=" * 50)
-            print("SUCCESS! Chrome automation is working!")
-            print("=" * 50)
-            print(f"\nScreenshot saved to: test_screenshot.png")
+        print("\n" + "=" * 50)
+        print("SUCCESS! Chrome automation is working!")
+        print("=" * 50)
+        print(f"\nScreenshot saved to: test_screenshot.png")
 
     except Exception as e:
         print(f"\nError: {e}")